@@ -14,16 +14,19 @@
 
 """Code to be called before and after certain events during testing.
 
-Currently four events have been registered:
+Currently five events have been registered:
 1. before_all
 2. before_feature
 3. before_scenario
-4. after_scenario
+4. before_step
+5. after_scenario
 """
 
 import os
 import psycopg2
 
+from src.ports import wait_for_ports
+
 # Mappings between supported features (like consuming message from Kafka) and
 # tags specified in feature files
 
@@ -72,6 +75,14 @@ def before_scenario(context, scenario):
         return
 
 
+def before_step(context, step):
+    """Run before each step is run."""
+    # services started by given steps must be up before they are used
+    if step.step_type != "given" and getattr(context, "pending_services", None):
+        wait_for_ports(context.pending_services)
+        context.pending_services = []
+
+
 def after_scenario(context, scenario):
     """Run after each scenario is run."""
     if "database" in scenario.effective_tags:
@@ -0,0 +1,49 @@
+# Copyright © 2023 Pavel Tisnovsky, Red Hat, Inc.
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Readiness checks for services listening on local TCP ports."""
+
+import asyncio
+import socket
+
+
+def port_is_open(port):
+    """Check if something accepts TCP connections on the given local port."""
+    with socket.socket() as s:
+        return s.connect_ex(("127.0.0.1", port)) == 0
+
+
+async def wait_for_port(port, timeout=5, interval=0.05):
+    """Wait until something accepts TCP connections on the given local port."""
+    loop = asyncio.get_running_loop()
+    deadline = loop.time() + timeout
+    while loop.time() < deadline:
+        with socket.socket() as s:
+            s.setblocking(False)
+            try:
+                await loop.sock_connect(s, ("127.0.0.1", port))
+                return
+            except OSError:
+                pass
+        await asyncio.sleep(interval)
+    raise RuntimeError(f"no service listening on port {port}")
+
+
+def wait_for_ports(ports, timeout=5):
+    """Wait until all given local ports accept connections, checking them concurrently."""
+
+    async def wait_all():
+        await asyncio.gather(*(wait_for_port(port, timeout) for port in ports))
+
+    asyncio.run(wait_all())
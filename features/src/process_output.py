@@ -14,6 +14,11 @@
 
 """Tooling to process output generated by finished process."""
 
+import os
+import selectors
+import subprocess
+import time
+
 
 # Services and tools written in Go can be compiled with -cover compilation option.
 # In this case each run of such service/tool will generated code coverage report,
@@ -27,9 +32,13 @@ def process_generated_output(context, out, return_code=None):
     """Process output generated by finished process."""
     assert out is not None
 
-    # interact with the process:
-    # read data from stdout and stderr, until end-of-file is reached
-    stdout, stderr = out.communicate()
+    if isinstance(out, subprocess.CompletedProcess):
+        # process started by subprocess.run has already been finished
+        stdout, stderr = out.stdout, out.stderr
+    else:
+        # interact with the process:
+        # read data from stdout and stderr, until end-of-file is reached
+        stdout, stderr = out.communicate()
 
     # basic checks if process was able to communicate with its parent
     assert stderr is None, "Error during check"
@@ -59,6 +68,67 @@ def process_generated_output(context, out, return_code=None):
     context.return_code = out.returncode
 
 
+def process_output_until(context, out, expected_messages, timeout):
+    """Process output generated by process, stopping it once all expected messages appear.
+
+    Output is read as it is produced. When every expected message has been
+    printed, the process is killed instead of waiting for its exit, but only
+    when coverage is not collected: binaries built with -cover write their
+    coverage data into GOCOVERDIR only on normal exit. The process is killed
+    and the step fails when it does not finish within given timeout (in seconds).
+    Exit code of the process is not checked.
+    """
+    assert out is not None
+
+    # coverage data would be lost if the process was killed
+    stop_early = "GOCOVERDIR" not in os.environ
+
+    remaining = {message.encode("utf-8") for message in expected_messages}
+    # expected message can be split between two chunks read from pipe
+    overlap = max((len(message) for message in remaining), default=0)
+
+    deadline = time.monotonic() + timeout
+    chunks = []
+    tail = b""
+    with selectors.DefaultSelector() as selector:
+        selector.register(out.stdout, selectors.EVENT_READ)
+        while not (stop_early and not remaining):
+            if not selector.select(max(deadline - time.monotonic(), 0)):
+                # deadline has passed, the process is killed below
+                break
+            chunk = os.read(out.stdout.fileno(), 1 << 16)
+            if not chunk:
+                # end of output has been reached
+                break
+            chunks.append(chunk)
+            window = tail + chunk
+            remaining = {message for message in remaining if message not in window}
+            tail = window[-overlap:]
+
+    try:
+        if stop_early and not remaining:
+            reap_process(out)
+        else:
+            out.wait(max(deadline - time.monotonic(), 0))
+    except subprocess.TimeoutExpired:
+        reap_process(out)
+        raise Exception(f"Process did not finish within {timeout} seconds")
+    finally:
+        out.stdout.close()
+
+    completed = subprocess.CompletedProcess(out.args, out.returncode, b"".join(chunks), None)
+    process_generated_output(context, completed)
+
+
+def reap_process(process):
+    """Kill the process and reap it so no zombie is left behind."""
+    process.kill()
+    try:
+        process.wait(timeout=0.1)
+    except subprocess.TimeoutExpired:
+        pass
+
+
 def filter_coverage_message(output):
     """Filter message about missing GOCOVERDIR etc."""
     return output.replace(COVERAGE_MESSAGE + "\n", "")
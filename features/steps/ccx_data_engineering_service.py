@@ -15,33 +15,99 @@
 """Implementation of test steps that run CCX Upgrade Risk Inference Service."""
 
 
+import atexit
+import hashlib
 import os
 import subprocess
-import time
 from behave import given
+from src.ports import port_is_open
+from src.process_output import reap_process
+
+
+# directory with logs generated by the service, one file per pooled worker
+LOGS_DIR = "logs/ccx-upgrades-data-eng"
+os.makedirs(LOGS_DIR, exist_ok=True)
+
+# environment of the test runner, the service gets it extended by test variables
+_base_env = os.environ.copy()
+
+# warm uvicorn workers kept alive between scenarios, keyed by port and the
+# environment overrides they were started with
+_services = {}
+
+
+def _stop_services():
+    """Kill and reap all pooled service processes."""
+    for popen in _services.values():
+        reap_process(popen)
+    _services.clear()
+
+
+atexit.register(_stop_services)
+
+
+def _log_path(key):
+    """Construct name of log file for worker identified by given pool key."""
+    port, env_overrides = key
+    digest = hashlib.sha1(repr(sorted(env_overrides)).encode("utf-8")).hexdigest()
+    return os.path.join(LOGS_DIR, f"{port}-{digest[:12]}.log")
+
+
+def _reset_service(key):
+    """Drop the pooled service from the pool if it died or never became ready."""
+    popen = _services.get(key)
+    if popen is not None and (popen.poll() is not None or not port_is_open(key[0])):
+        reap_process(_services.pop(key))
 
 
 @given("The CCX Data Engineering Service is running on port {port:d} with envs")
 def start_ccx_upgrades_data_eng(context, port):
-    """Run ccx-upgrades-data-eng for a test and prepare its stop."""
-    params = [
-        "uvicorn",
-        "ccx_upgrades_data_eng.main:app",
-        "--port",
-        str(port),
-        "--log-config",
-        "config/ccx-upgrades-data-eng_logging.yaml",
-    ]
-    env = os.environ.copy()
-
-    # Update the environment with variables configured by the test
-    for row in context.table:
-        var, val = row["variable"], row["value"]
-        env[var] = val
-
-    f = open(f"logs/ccx-upgrades-data-eng/{context.scenario}.log", "w")
-
-    popen = subprocess.Popen(params, stdout=f, stderr=f, env=env)
-    assert popen is not None
-    time.sleep(2)
-    context.add_cleanup(popen.terminate)
+    """Run ccx-upgrades-data-eng for a test, reusing a warm process if possible.
+
+    Logs are written per worker, not per scenario: all scenarios served by
+    workers with the same port and envs share one log file, which is never
+    truncated. Each scenario and each worker start is marked by its own line.
+    """
+    if not hasattr(context, "pending_services"):
+        context.pending_services = []
+
+    env_overrides = {row["variable"]: row["value"] for row in context.table}
+    key = (port, frozenset(env_overrides.items()))
+
+    log_path = _log_path(key)
+
+    popen = _services.get(key)
+    spawn = popen is None or popen.poll() is not None
+    if spawn:
+        # the port can be held by a service started with different envs
+        for other_key in [k for k in _services if k[0] == port]:
+            reap_process(_services.pop(other_key))
+
+    with open(log_path, "a") as f:
+        f.write(f"=== scenario: {context.scenario} ===\n")
+
+    if spawn:
+        params = [
+            "uvicorn",
+            "ccx_upgrades_data_eng.main:app",
+            "--port",
+            str(port),
+            "--log-config",
+            "config/ccx-upgrades-data-eng_logging.yaml",
+        ]
+        # environment extended by variables configured by the test
+        env = {**_base_env, **env_overrides}
+
+        # the child keeps its own copy of the descriptor, ours can be closed;
+        # append mode keeps output of earlier workers and scenario markers
+        with open(log_path, "a") as f:
+            popen = subprocess.Popen(params, stdout=f, stderr=f, env=env)
+            f.write(f"=== worker started (pid {popen.pid}) ===\n")
+        assert popen is not None
+        _services[key] = popen
+
+    # readiness of all services used by the scenario is checked concurrently
+    # before its first non-given step, for a warm worker it is just one connect
+    context.pending_services.append(port)
+
+    context.add_cleanup(_reset_service, key)
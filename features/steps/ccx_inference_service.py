@@ -18,6 +18,7 @@ import os
 import subprocess
 import time
 from behave import given
+from src.process_output import reap_process
 
 
 @given("The CCX Inference Service is running on port {port:d}")
@@ -30,4 +31,4 @@ def start_ccx_inference_service(context, port):
     popen = subprocess.Popen(params, stdout=f, stderr=f, env=env)
     assert popen is not None
     time.sleep(0.5)
-    context.add_cleanup(popen.terminate)
+    context.add_cleanup(reap_process, popen)
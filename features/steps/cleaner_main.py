@@ -14,8 +14,11 @@
 
 """Implementation of test steps that run Insights Aggregator Cleaner and check its output."""
 
+import os
+import re
 import subprocess
-from src.process_output import process_generated_output
+import sys
+from src.process_output import process_generated_output, process_output_until
 
 from behave import then, when
 
@@ -23,23 +26,97 @@ from behave import then, when
 # default name of file generated by Insights Aggregator Cleaner during testing
 test_output = "test"
 
+# help message displayed by Insights Aggregator Cleaner
+expected_help_output = """Clowder is not enabled, skipping init...
+Usage of insights-results-aggregator-cleaner:
+  -authors
+        show authors
+  -cleanup
+        perform database cleanup
+  -clusters string
+        list of clusters to cleanup
+  -fill-in-db
+        fill-in database by test data
+  -max-age string
+        max age for displaying old records
+  -multiple-rule-disable
+        list clusters with the same rule(s) disabled by different users
+  -output string
+        filename for old cluster listing
+  -show-configuration
+        show configuration
+  -summary
+        print summary table after cleanup
+  -vacuum
+        vacuum database
+  -version
+        show cleaner version""".strip()
+
+# messages expected to be printed during database vacuuming
+vacuum_messages = (
+    "DB connection configuration",
+    "driverName",
+    "postgres",
+    "Vacuuming started",
+    "Vacuuming finished",
+)
+vacuum_messages_re = re.compile("|".join(map(re.escape, vacuum_messages)))
+
+# messages expected to be logged when configuration is displayed
+configuration_messages = (
+    "DB connection configuration",
+    "Storage configuration",
+    "Logging configuration",
+    "Cleaner configuration",
+)
+
+# message attribute in structured log lines
+message_re = re.compile(rb'"message":"([^"]+)"')
+
+# buffering options for pipes used to catch cleaner output; pipesize (kernel
+# pipe capacity) is supported by Popen since Python 3.10
+pipe_options = {"bufsize": 1 << 16}
+if sys.version_info >= (3, 10):
+    pipe_options["pipesize"] = 1 << 20
+
+# fcntl command to change pipe capacity (Linux only)
+F_SETPIPE_SZ = 1031
+
+
+def enlarge_pipe(out):
+    """Enlarge capacity of stdout pipe when Popen can not do it by itself."""
+    if "pipesize" in pipe_options:
+        return
+    try:
+        import fcntl
+
+        fcntl.fcntl(out.stdout.fileno(), F_SETPIPE_SZ, 1 << 20)
+    except (ImportError, OSError):
+        # not supported on this platform, keep the default pipe capacity
+        pass
+
+
+# maximal time (in seconds) given to one cleaner run
+cleaner_timeout = 30
+
+
+def run_cleaner(*args):
+    """Run the cleaner with given arguments and wait for its completion."""
+    return subprocess.run(
+        ["insights-results-aggregator-cleaner", *args],
+        stdout=subprocess.PIPE,
+        stderr=subprocess.STDOUT,
+        timeout=cleaner_timeout,
+        **pipe_options,
+    )
+
 
 @when("I run the cleaner to display all records older than {age}")
 def run_cleaner_for_older_records(context, age):
     """Start the cleaner to retrieve list of older records."""
-    out = subprocess.Popen(
-        [
-            "insights-results-aggregator-cleaner",
-            "--output",
-            test_output,
-            "--max-age",
-            age,
-        ],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-    )
+    out = run_cleaner("--output", test_output, "--max-age", age)
 
-    # check if subprocess has been started and its output caught
+    # check if subprocess has been finished and its output caught
     assert out is not None
 
     # it is expected that exit code will be 0
@@ -49,13 +126,9 @@ def run_cleaner_for_older_records(context, age):
 @when("I run the cleaner with the {flag} command line flag")
 def run_cleaner_with_flag(context, flag):
     """Start the cleaner with given command-line flag."""
-    out = subprocess.Popen(
-        ["insights-results-aggregator-cleaner", flag],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-    )
+    out = run_cleaner(flag)
 
-    # check if subprocess has been started and its output caught
+    # check if subprocess has been finished and its output caught
     assert out is not None
 
     # it is expected that exit code will be 0 or 2
@@ -65,13 +138,9 @@ def run_cleaner_with_flag(context, flag):
 @when("I run the cleaner with command to delete cluster {cluster}")
 def run_cleaner_to_cleanup_cluster(context, cluster):
     """Start the cleaner clean up given cluster."""
-    out = subprocess.Popen(
-        ["insights-results-aggregator-cleaner", "--cleanup", "--clusters", cluster],
-        stdout=subprocess.PIPE,
-        stderr=subprocess.STDOUT,
-    )
+    out = run_cleaner("--cleanup", "--clusters", cluster)
 
-    # check if subprocess has been started and its output caught
+    # check if subprocess has been finished and its output caught
     assert out is not None
 
     # it is expected that exit code will be 0
@@ -85,13 +154,16 @@ def start_db_vacuum(context):
         ["insights-results-aggregator-cleaner", "-vacuum"],
         stdout=subprocess.PIPE,
         stderr=subprocess.STDOUT,
+        **pipe_options,
     )
 
     # check if subprocess has been started and its output caught
     assert out is not None
+    enlarge_pipe(out)
 
-    # it is expected that exit code will be 0
-    process_generated_output(context, out, 0)
+    # the cleaner is stopped as soon as vacuuming is reported as finished
+    # (unless coverage is collected), so its exit code is not checked
+    process_output_until(context, out, vacuum_messages, cleaner_timeout)
 
 
 @then("I should see information about vacuuming process")
@@ -99,62 +171,27 @@ def check_db_vacuuming(context):
     """Check if DB vacuuming were started and finished."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
-
-    expected_messages = (
-        "DB connection configuration",
-        "driverName",
-        "postgres",
-        "Vacuuming started",
-        "Vacuuming finished",
-    )
+    assert isinstance(context.output, list), "wrong type of output"
 
-    # iterate over all expected messages and try to find them in caught output
-    for expected_message in expected_messages:
-        for line in context.output:
-            if expected_message in line:
-                break
-        else:
-            raise Exception(f"Message '{expected_message}' was not printed during vacuuming")
+    # try to find all expected messages in caught output in one pass
+    found = set(vacuum_messages_re.findall("\n".join(context.output)))
+    missing = set(vacuum_messages) - found
+    if missing:
+        raise Exception(f"Messages {sorted(missing)} were not printed during vacuuming")
 
 
 def check_help_from_cleaner(context):
     """Check if help is displayed by cleaner."""
-    expected_output = """Clowder is not enabled, skipping init...
-Usage of insights-results-aggregator-cleaner:
-  -authors
-        show authors
-  -cleanup
-        perform database cleanup
-  -clusters string
-        list of clusters to cleanup
-  -fill-in-db
-        fill-in database by test data
-  -max-age string
-        max age for displaying old records
-  -multiple-rule-disable
-        list clusters with the same rule(s) disabled by different users
-  -output string
-        filename for old cluster listing
-  -show-configuration
-        show configuration
-  -summary
-        print summary table after cleanup
-  -vacuum
-        vacuum database
-  -version
-        show cleaner version"""
-
     assert context.stdout is not None
-    stdout = context.stdout.decode("utf-8").replace("\t", "    ")
+    stdout = context.stdout.replace(b"\t", b"    ").decode("utf-8")
 
     # preliminary checks
     assert stdout is not None, "stdout object should exist"
-    assert type(stdout) is str, "wrong type of stdout object"
+    assert isinstance(stdout, str), "wrong type of stdout object"
 
     # check the output
-    assert stdout.strip() == expected_output.strip(), "{} != {}".format(
-        stdout, expected_output
+    assert stdout.strip() == expected_help_output, "{} != {}".format(
+        stdout, expected_help_output
     )
 
 
@@ -162,7 +199,7 @@ def check_version_from_cleaner(context):
     """Check if version info is displayed by cleaner."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert (
@@ -174,7 +211,7 @@ def check_authors_info_from_cleaner(context):
     """Check if information about authors is displayed by cleaner."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert (
@@ -187,49 +224,36 @@ def check_cleaner_configuration(context):
     """Check if information about actual configuration is displayed by cleaner."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
-
-    expected_messages = (
-        "DB connection configuration",
-        "Storage configuration",
-        "Logging configuration",
-        "Cleaner configuration",
-    )
+    assert isinstance(context.output, list), "wrong type of output"
 
-    # iterate over all expected messages and try to find them in caught output
-    for expected_message in expected_messages:
-        for line in context.output:
-            if f'"message":"{expected_message}"' in line:
-                break
-        else:
-            raise Exception(f"Message '{expected_message}' was not found in configuration")
+    # all messages found in raw output, no need to join decoded lines again
+    found = {m.decode("utf-8") for m in message_re.findall(context.stdout)}
+    missing = set(configuration_messages) - found
+    if missing:
+        raise Exception(f"Messages {sorted(missing)} were not found in configuration")
 
 
 @then("I should see empty list of records")
 def check_empty_list_of_records(context):
     """Check if the cleaner displays empty list of records."""
-    with open(test_output, "r") as fin:
-        content = fin.read()
-        assert content == "", "expecting empty list of clusters"
+    assert os.path.getsize(test_output) == 0, "expecting empty list of clusters"
 
 
 @then("I should see the following clusters")
 def check_non_empty_list_of_records(context):
     """Check if the cleaner displays the suggested clusters."""
-    # set of expected clusters
-    expected_clusters = set(item["cluster"] for item in context.table)
-
-    # set of actually found clusters
-    found_clusters = set()
-
-    # check content of file generated during testing by Cleaner tool
-    with open(test_output, "r") as fin:
-        assert fin is not None
-        for line in fin:
-            assert line is not None
-            items = line.split(",")
-            cluster_name = items[0]
-            found_clusters.add(cluster_name)
+    # set of expected clusters, cached on the table as it can be checked repeatedly
+    expected_clusters = getattr(context.table, "_cluster_set", None)
+    if expected_clusters is None:
+        expected_clusters = frozenset(item["cluster"] for item in context.table)
+        context.table._cluster_set = expected_clusters
+
+    # set of actually found clusters read from file generated during testing
+    # by Cleaner tool, cluster name is stored in the first column
+    with open(test_output, "rb") as fin:
+        found_clusters = {
+            ln.split(b",", 1)[0].decode("ascii") for ln in fin.read().splitlines() if ln
+        }
 
     # compare both sets
     assert expected_clusters == found_clusters, "Difference: {}".format(
@@ -54,7 +54,7 @@ def check_message_in_output(context, message):
     """Check if output generated by tested service contains given message."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output, line by line
     for line in context.output:
@@ -49,12 +49,7 @@ def request_endpoint_with_formatted_body(context, endpoint, hostname, port, key)
     Each row of the table will be converted into an element on an array
     in the request body.
     """
-    values = list()
-
-    for row in context.table:
-        kind = row["kind"]
-        value = row["value"]
-        values.append(f"{kind}|{value}")
+    values = [f"{row['kind']}|{row['value']}" for row in context.table]
 
     data = {key: values}
     context.response = requests.get(
@@ -66,12 +61,7 @@ def request_endpoint_with_formatted_body(context, endpoint, hostname, port, key)
 @when("I request the {endpoint} endpoint in {hostname:w}:{port:d} with following parameters")
 def request_endpoint_with_url_params(context, endpoint, hostname, port):
     """Perform a request to the server defined by URL to a given endpoint."""
-    params = dict()
-
-    for row in context.table:
-        name = row["param"]
-        value = row["value"]
-        params[name] = value
+    params = {row["param"]: row["value"] for row in context.table}
 
     context.response = requests.get(
         f"http://{hostname}:{port}/{endpoint}",
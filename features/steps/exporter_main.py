@@ -82,7 +82,7 @@ Usage of insights-results-aggregator-exporter:
 
     # preliminary checks
     assert stdout is not None, "stdout object should exist"
-    assert type(stdout) is str, "wrong type of stdout object"
+    assert isinstance(stdout, str), "wrong type of stdout object"
 
     # check the output
     assert stdout.strip() == expected_output.strip(), "{} != {}".format(
@@ -94,7 +94,7 @@ def check_version_from_exporter(context):
     """Check if version info is displayed by exporter."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert (
@@ -106,7 +106,7 @@ def check_authors_info_from_exporter(context):
     """Check if information about authors is displayed by exporter."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert (
@@ -119,7 +119,7 @@ def check_configuration_info_from_exporter(context):
     """Check if information about configuration is displayed by exporter."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     stdout = context.stdout.decode("utf-8").replace("\t", "    ")
 
@@ -19,6 +19,7 @@ import os
 import subprocess
 import time
 from behave import given
+from src.process_output import reap_process
 
 
 @given("The Template Renderer is running")
@@ -45,4 +46,4 @@ def start_template_renderer(context):
     popen = subprocess.Popen(params, stdout=f, stderr=f, cwd=template_renderer_path)
     assert popen is not None
     time.sleep(1)
-    context.add_cleanup(popen.terminate)
+    context.add_cleanup(reap_process, popen)
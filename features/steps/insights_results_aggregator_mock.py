@@ -66,7 +66,7 @@ The commands are:
 
     # preliminary checks
     assert stdout is not None, "stdout object should exist"
-    assert type(stdout) is str, "wrong type of stdout object"
+    assert isinstance(stdout, str), "wrong type of stdout object"
 
     # check the output
     assert stdout.strip() == expected_output.strip(), "{} != {}".format(
@@ -78,7 +78,7 @@ def check_version_from_mock(context):
     """Check if version info is displayed by Insights Results Aggregator Mock."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert "Version:\t0.1" in context.output, "Caught output: {}".format(context.output)
@@ -88,7 +88,7 @@ def check_authors_info_from_mock(context):
     """Check if information about authors is displayed by Insights Results Aggregator Mock."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert (
@@ -101,7 +101,7 @@ def check_actual_configuration(context):
     """Check if actual configuration is displayed by Insights Results Aggregator Mock."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert "Server" in context.output[1], "Caught output: {}".format(context.output)
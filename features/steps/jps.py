@@ -63,7 +63,7 @@ def find_jvm_application(context, application):
     """Find the given JVM-based application from list generated by jps tool."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # flag if JVM-based application name has been found in jps output
     found = False
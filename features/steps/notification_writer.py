@@ -103,7 +103,7 @@ Usage of ccx-notification-writer:
 
     # preliminary checks
     assert stdout is not None, "stdout object should exist"
-    assert type(stdout) is str, "wrong type of stdout object"
+    assert isinstance(stdout, str), "wrong type of stdout object"
 
     # don't mess with silly tabs
 
@@ -118,7 +118,7 @@ def check_version_from_ccx_notification_writer(context):
     """Check if version info is displayed by CCX Notification Writer."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert (
@@ -130,7 +130,7 @@ def check_authors_info_from_ccx_notification_writer(context):
     """Check if information about authors is displayed by CCX Notification Writer."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output
     assert (
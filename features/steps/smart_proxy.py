@@ -65,7 +65,7 @@ The commands are:
 
     # preliminary checks
     assert stdout is not None, "stdout object should exist"
-    assert type(stdout) is str, "wrong type of stdout object"
+    assert isinstance(stdout, str), "wrong type of stdout object"
 
     # check the output
     assert stdout.strip() == expected_output.strip(), "{} != {}".format(
@@ -77,7 +77,7 @@ def check_version_from_smart_proxy(context):
     """Check if version info is displayed by Smart Proxy."""
     # preliminary checks
     assert context.output is not None
-    assert type(context.output) is list, "wrong type of output"
+    assert isinstance(context.output, list), "wrong type of output"
 
     # check the output, line by line
     for line in context.output: